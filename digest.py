@@ -1,10 +1,35 @@
 import os
+import re
 import json
+import hashlib
+import importlib
+import shutil
+import sqlite3
+import random
+import threading
+import time
+import functools
 import requests
 import subprocess
-from datetime import datetime, timedelta
+from collections import Counter, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import anthropic
+import jinja2
+
+# orjson parses and serializes in C when it's installed; the stdlib json module covers the rest
+try:
+    import orjson
+    _json_loads = orjson.loads
+    def _json_dumps(obj):
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
 
 # ── Load your API keys from the .env file ─────────────────────────────────────
 _env_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".env")
@@ -18,31 +43,70 @@ if not ANTHROPIC_API_KEY:
 
 # ── Load your industry config ─────────────────────────────────────────────────
 with open(os.path.join(os.path.dirname(__file__), "config.json")) as f:
-    config = json.load(f)
+    config = _json_loads(f.read())
+
+# NewsAPI OR-queries and the search window are fixed for the run, so build them once here
+for _ind in config["industries"]:
+    _ind["_query"] = " OR ".join(f'"{term}"' for term in _ind["search_terms"])
+for _acct in config.get("accounts", []):
+    _acct["_query"] = " OR ".join(f'"{n}"' for n in [_acct["name"]] + _acct.get("aliases", []))
+FROM_DATE = (datetime.now() - timedelta(days=config.get("days_back", 7))).strftime("%Y-%m-%d")
 
 # ── Set up the Claude client ──────────────────────────────────────────────────
-claude = anthropic.Anthropic(api_key=ANTHROPIC_API_KEY)
+# Retries are handled by _with_retry below, so the SDK's own retry loop is off
+claude = anthropic.Anthropic(api_key=ANTHROPIC_API_KEY, max_retries=0)
+
+# ── Shared HTTP session ───────────────────────────────────────────────────────
+# One pooled, keep-alive session for NewsAPI, RSS, GitHub Pages and Slack, so each
+# host pays the TCP+TLS handshake once. Idempotent requests retry on 429/5xx,
+# honouring Retry-After.
+SESSION = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,   # industries, their feeds and account lookups all fetch at once
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504]),
+)
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)   # some RSS feeds are still plain HTTP
 
 ARTICLES_TARGET = config["articles_per_industry"]
 ARTICLES_FETCH  = 12
 ACCOUNTS_FETCH  = 5
+CLAUDE_WORKERS  = 8   # concurrent Claude requests — keeps us inside Anthropic rate limits
+BATCH_SIZE      = 8   # articles per batched evaluation call
+ACCOUNT_AHEAD   = 3   # account candidates evaluated at once; a hit wastes at most ACCOUNT_AHEAD - 1 calls
 
+CLAUDE_MODEL    = "claude-haiku-4-5-20251001"
+
+# Bump whenever the evaluation prompt changes so cached results are re-evaluated
+PROMPT_VERSION  = "2"
+CACHE_PATH      = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".digest_cache.sqlite3")
+CACHE_TTL_DAYS  = 7    # covers re-runs of the same week's digest; older verdicts are re-evaluated
 
-# ── STEP 1: Fetch articles from NewsAPI ──────────────────────────────────────
-def fetch_articles(industry):
-    query = " OR ".join([f'"{term}"' for term in industry["search_terms"]])
-    from_date = (datetime.now() - timedelta(days=config["days_back"])).strftime("%Y-%m-%d")
 
-    response = requests.get("https://newsapi.org/v2/everything", params={
+# ── STEP 1: Fetch articles from NewsAPI ──────────────────────────────────────
+@functools.lru_cache(maxsize=64)
+def _newsapi_search(query, from_date, page_size):
+    """Raw JSON body for one NewsAPI /everything query, memoized for the run so a repeated
+    query costs no request or quota. Callers decode it, so each gets fresh dicts."""
+    response = SESSION.get("https://newsapi.org/v2/everything", params={
         "q":        query,
         "from":     from_date,
         "sortBy":   "relevancy",
         "language": "en",
-        "pageSize": ARTICLES_FETCH,
+        "pageSize": page_size,
         "apiKey":   NEWS_API_KEY,
-    })
+    }, timeout=10)
+    return response.text
+
+
+def fetch_articles(industry):
+    try:
+        data = _json_loads(_newsapi_search(industry["_query"], FROM_DATE, ARTICLES_FETCH))
+    except requests.RequestException as e:
+        print(f"  ✗ NewsAPI request failed for {industry['name']}: {e}")
+        return []
 
-    data = response.json()
     if data["status"] == "ok":
         return data["articles"]
     else:
@@ -53,7 +117,19 @@ def fetch_articles(industry):
 # ── STEP 1b: Fetch articles from RSS feeds ───────────────────────────────────
 def fetch_from_rss(feed_url):
     import feedparser
-    feed    = feedparser.parse(feed_url)
+    # Download through the pooled session (timeout, retries, keep-alive) and hand
+    # feedparser the body; its own urllib fetch has none of those.
+    try:
+        r = SESSION.get(feed_url, timeout=10)
+        r.raise_for_status()
+    except requests.RequestException as e:
+        print(f"    ⚠ RSS fetch error ({feed_url}): {e}")
+        return []
+    # Content-Type drives charset detection; Content-Location is the base for relative links
+    feed    = feedparser.parse(r.content, response_headers={
+        "content-type":     r.headers.get("Content-Type", ""),
+        "content-location": r.url,
+    })
     source  = feed.feed.get("title", feed_url)
     articles = []
     for entry in feed.entries[:ARTICLES_FETCH]:
@@ -77,37 +153,82 @@ def fetch_from_rss(feed_url):
 
 
 # ── Deduplication ─────────────────────────────────────────────────────────────
+_TRACKING_PARAMS = ("utm_", "fbclid", "gclid", "mc_cid", "mc_eid")
+_NON_ALNUM       = re.compile(r"[^\w\s]|_")   # exactly what isalnum()/isspace() reject
+
+def _canonical_url(url):
+    """Normalize a URL so the same story reached via different tracking links compares equal."""
+    parts = urlsplit(url.strip())
+    # Sorted so the same parameters in a different order still compare equal
+    query = sorted((k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+                   if not k.lower().startswith(_TRACKING_PARAMS))
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip("/"), urlencode(query), ""))
+
+
 def deduplicate_articles(candidates):
-    """Remove articles whose titles are 70%+ similar to one already seen."""
-    seen, unique = [], []
+    """Remove repeat URLs and articles whose titles are 70%+ similar to one already seen."""
+    # Titles can only overlap through shared words, so index kept titles by word and
+    # score just the ones that share something instead of comparing against all of them.
+    seen, unique, by_word = [], [], {}
+    seen_urls, seen_titles = set(), set()
     for article in candidates:
+        # Cheap exact checks first: same canonical URL or same normalized title
+        url = _canonical_url(article.get("url") or "")
+        if url and url in seen_urls:
+            continue
         title = article.get("title", "").lower().strip()
-        title_clean = "".join(c for c in title if c.isalnum() or c.isspace())
+        if title and title in seen_titles:
+            continue
+        title_clean = _NON_ALNUM.sub("", title)
         words_a = set(title_clean.split())
-        is_dup = False
-        for seen_words in seen:
-            if words_a and seen_words:
-                overlap = len(words_a & seen_words) / max(len(words_a), len(seen_words))
-                if overlap >= 0.7:
-                    is_dup = True
-                    break
+        # seen holds each kept title's word count; integer math avoids a float divide per pair
+        la     = len(words_a)
+        shared = Counter(i for w in words_a for i in by_word.get(w, ()))
+        is_dup = any(n * 10 >= 7 * max(la, seen[i]) for i, n in shared.items())
         if not is_dup:
-            seen.append(words_a)
+            for w in words_a:
+                by_word.setdefault(w, []).append(len(seen))
+            seen.append(la)
             unique.append(article)
+            if url:
+                seen_urls.add(url)
+            if title:
+                seen_titles.add(title)
     return unique
 
 
+# ── Cheap local pre-filter ────────────────────────────────────────────────────
+_WORD = re.compile(r"[a-z0-9]+")
+
+def worth_evaluating(article, industry):
+    """Reject candidates Claude would certainly turn down, without spending an API call.
+
+    Drops removed/empty stories, ones with almost no text, and ones that share no word
+    with the industry's name or search terms.
+    """
+    title = (article.get("title") or "").strip()
+    if not title or title == "[Removed]":
+        return False
+    text = f"{title} {article.get('description') or ''} {article.get('content') or ''}".lower()
+    if len(text.strip()) < 40:
+        return False
+    terms = set(_WORD.findall(" ".join(industry["search_terms"] + [industry["name"]]).lower()))
+    return bool(terms & set(_WORD.findall(text)))
+
+
 # ── Date formatting ────────────────────────────────────────────────────────────
-def format_date(date_str):
-    """Return a human-readable relative date from a publishedAt string."""
+@functools.lru_cache(maxsize=4096)
+def format_date(date_str, now):
+    """Return a human-readable relative date from a publishedAt string, as of `now` (UTC)."""
     if not date_str:
         return ""
-    from datetime import timezone
     import email.utils
     dt = None
     try:
-        dt = datetime.strptime(date_str[:19], "%Y-%m-%dT%H:%M:%S").replace(tzinfo=timezone.utc)
-    except Exception:
+        # NewsAPI sends ISO 8601; a string without an offset is taken as UTC
+        dt = datetime.fromisoformat(date_str)
+        dt = (dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)).astimezone(timezone.utc)
+    except ValueError:
         pass
     if dt is None:
         try:
@@ -116,7 +237,6 @@ def format_date(date_str):
             pass
     if dt is None:
         return ""
-    now = datetime.now(timezone.utc)
     days = (now - dt).days
     if days == 0:
         hours = (now - dt).seconds // 3600
@@ -129,30 +249,141 @@ def format_date(date_str):
         return dt.strftime("%b %d")
 
 
-# ── STEP 2: Have Claude evaluate relevance and generate structured output ─────
-def evaluate_and_summarize(article, industry_name):
-    prompt = f"""You are a senior strategist at Matic Digital, a full-service branding, design, and technology agency.
-You work with clients in the {industry_name} space.
+# ── Wait-and-retry for transient Claude errors ───────────────────────────────
+RETRY_STATUSES    = {429, 500, 502, 503, 504, 529}
+# An error event mid-stream arrives after the 200 headers, so only its body says what it was
+RETRY_ERROR_TYPES = {"overloaded_error", "api_error", "rate_limit_error"}
 
-Matic Digital's four service areas:
-1. Brand & Creative — brand strategy & identity, content & messaging, brand systems & guidelines, rebranding & evolution, brand activation
-2. Experience Design — personas & journey mapping, taxonomy & content strategy, design systems, UX/UI design, interaction & prototyping, user testing & validation
-3. Software & Technology — website & software development, headless & monolithic CMS, platform modernization & integrations, full-stack engineering, security & compliance, ongoing support
-4. Growth & Marketing Ops — market & audience intelligence, white space opportunity, go-to-market activation, SEO/GEO/AI visibility, content systems, lead generation & sales conversion, performance optimization
+# Read errors while iterating a stream come straight from the SDK's HTTP client instead of
+# as APIConnectionError; depending on the anthropic release that client is httpx or httpx2
+_STREAM_READ_ERRORS = ()
+for _http in ("httpx", "httpx2"):
+    try:
+        _STREAM_READ_ERRORS += (importlib.import_module(_http).TransportError,)
+    except ImportError:
+        pass
 
-Evaluate this article. Is it genuinely relevant to the {industry_name} industry?
+# Industries and their articles are evaluated concurrently; this caps in-flight Claude calls overall
+_claude_slots = threading.BoundedSemaphore(CLAUDE_WORKERS)
 
-RELEVANT = meaningful news, trends, innovation, regulation, market shifts, or business developments directly in the {industry_name} industry.
-NOT RELEVANT = reject any of the following without exception: stock/share price movements, investment analyst ratings, obituaries, awards or scholarship announcements, local human-interest stories, sports scores, celebrity gossip, viral social media content, political news not directly tied to {industry_name} regulation or policy, generic science/research with no clear industry application, or anything that would only loosely connect to {industry_name} with a stretch of imagination.
+# Token accounting across the run, so prompt-cache hit rate shows up in the log
+_usage      = {"cache_read_input_tokens": 0, "cache_creation_input_tokens": 0, "input_tokens": 0}
+_usage_lock = threading.Lock()
 
-Article:
-Title: {article['title']}
+def _record_usage(message):
+    usage = getattr(message, "usage", None)
+    if usage is None:
+        return
+    with _usage_lock:
+        for field in _usage:
+            _usage[field] += getattr(usage, field, None) or 0
+
+def _is_transient(e):
+    if not isinstance(e, anthropic.APIStatusError):
+        return True   # connection and stream read errors
+    if e.status_code in RETRY_STATUSES:
+        return True
+    error = e.body.get("error") if isinstance(e.body, dict) else None
+    return isinstance(error, dict) and error.get("type") in RETRY_ERROR_TYPES
+
+def _with_retry(fn, *, max_tries=5, base=1.5):
+    """Call fn() in a Claude slot, retrying rate limits, overloads, 5xx and connection errors with exponential backoff."""
+    for attempt in range(max_tries):
+        try:
+            with _claude_slots:
+                result = fn()
+            _record_usage(result)
+            return result
+        except (anthropic.APIStatusError, anthropic.APIConnectionError, *_STREAM_READ_ERRORS) as e:
+            is_status = isinstance(e, anthropic.APIStatusError)
+            if attempt == max_tries - 1 or not _is_transient(e):
+                raise
+            try:
+                delay = float(e.response.headers.get("retry-after")) if is_status else None
+            except (TypeError, ValueError):
+                delay = None
+            if delay is None:
+                delay = base ** attempt + random.random()
+            time.sleep(delay)
+
+
+# ── Evaluation cache ──────────────────────────────────────────────────────────
+_cache_db   = None
+_cache_lock = threading.Lock()
+
+def _cache_conn():
+    global _cache_db
+    if _cache_db is None:
+        _cache_db = sqlite3.connect(CACHE_PATH, check_same_thread=False)
+        _cache_db.execute("CREATE TABLE IF NOT EXISTS evaluations (key TEXT PRIMARY KEY, json TEXT, stored_at REAL)")
+        # Expired rows are never read again, so prune them and keep the cached file small
+        _cache_db.execute("DELETE FROM evaluations WHERE stored_at < ?", (time.time() - CACHE_TTL_DAYS * 86400,))
+        _cache_db.commit()
+    return _cache_db
+
+
+def _cache_key(article, scope):
+    """scope is the industry name, or _account_scope(account) for named-account checks."""
+    return hashlib.sha256("|".join((article["url"], scope, CLAUDE_MODEL, PROMPT_VERSION)).encode()).hexdigest()
+
+
+def _account_scope(account):
+    # Type and context both change the account prompt, so they're part of the key
+    return "|".join(("account", account["name"], account.get("type", "prospect"), account.get("context", "")))
+
+
+def _cache_get(key):
+    with _cache_lock:
+        row = _cache_conn().execute("SELECT json FROM evaluations WHERE key = ?", (key,)).fetchone()
+    return _json_loads(row[0]) if row else None
+
+
+def _cache_put(key, result):
+    # Don't remember failed calls — they should be retried next run
+    if "error" in result:
+        return
+    with _cache_lock:
+        db = _cache_conn()
+        db.execute("INSERT OR REPLACE INTO evaluations (key, json, stored_at) VALUES (?, ?, ?)",
+                   (key, _json_dumps(result), time.time()))
+        db.commit()
+
+
+def cached_evaluation(scope):
+    """Persist fn(article, target) on disk for CACHE_TTL_DAYS, keyed by article URL +
+    scope(target) + CLAUDE_MODEL + PROMPT_VERSION."""
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(article, target):
+            if not article.get("url"):
+                return fn(article, target)
+            key    = _cache_key(article, scope(target))
+            cached = _cache_get(key)
+            if cached is not None:
+                return cached
+            result = fn(article, target)
+            _cache_put(key, result)
+            return result
+        return wrapper
+    return decorate
+
+
+# ── STEP 2: Have Claude evaluate relevance and generate structured output ─────
+# Prompt pieces shared by the single-article and batch evaluation prompts
+def _relevance_rules(industry_name):
+    return f"""RELEVANT = meaningful news, trends, innovation, regulation, market shifts, or business developments directly in the {industry_name} industry.
+NOT RELEVANT = reject any of the following without exception: stock/share price movements, investment analyst ratings, obituaries, awards or scholarship announcements, local human-interest stories, sports scores, celebrity gossip, viral social media content, political news not directly tied to {industry_name} regulation or policy, generic science/research with no clear industry application, or anything that would only loosely connect to {industry_name} with a stretch of imagination."""
+
+
+def _article_block(article):
+    return f"""Title: {article['title']}
 Source: {article['source']['name']}
 Description: {article.get('description', '')}
-Content: {article.get('content', '')}
+Content: {article.get('content', '')}"""
 
-If relevant, respond with ONLY this JSON (no other text):
-{{
+
+def _output_spec(industry_name):
+    return f"""{{
   "relevant": true,
   "summary": "2-3 sentences. Write like a smart colleague telling you what they just read — direct, clear, no fluff. Active voice. No jargon. Say what happened and why it matters.",
   "agency_relevance": "2-3 sentences. What does this signal for {industry_name} clients specifically? Name which of Matic's service areas are most relevant — Brand & Creative, Experience Design, Software & Technology, or Growth & Marketing Ops — and say plainly why. Sound like someone who has been in the room, not someone writing a proposal.",
@@ -165,52 +396,178 @@ If relevant, respond with ONLY this JSON (no other text):
     "subject": "A specific, natural subject line referencing the news — not generic, not clickbait. 8 words max.",
     "body": "3-4 sentences addressed to [First Name] at [Company]. Open by referencing the article naturally — not 'I saw this and thought of you.' Make one sharp observation about what it signals for their business or space. Connect it to a genuine question or brief conversation. Close with a light, specific ask — not 'let me know if you want to chat.' Sound like a smart colleague, not a sales rep. No fluff, no pitch, no jargon."
   }}
-}}
+}}"""
+
 
-Tone guide:
+TONE_GUIDE = """Tone guide:
 - Write the way COLLINS, Area17, and Matic Digital write: confident, human, a little sharp.
 - Short sentences. No hedging. No padding.
 - Never use: leverage, solutions, deliverables, synergy, holistic, utilize, impactful.
 - Talking points should sound like things a person would actually say — not bullets from a deck.
-- The outreach email should be the kind of message a senior strategist would actually send — not a template, not a pitch.
+- The outreach email should be the kind of message a senior strategist would actually send — not a template, not a pitch."""
+
+# Identical for every evaluation and the Slack briefing, so it goes in a system block
+# marked for Anthropic prompt caching — calls after the first read it from cache.
+# (Prefixes shorter than the model's minimum cacheable length are simply not cached.)
+MATIC_PREAMBLE = f"""You are a senior strategist at Matic Digital, a full-service branding, design, and technology agency.
+
+Matic Digital's four service areas:
+1. Brand & Creative — brand strategy & identity, content & messaging, brand systems & guidelines, rebranding & evolution, brand activation
+2. Experience Design — personas & journey mapping, taxonomy & content strategy, design systems, UX/UI design, interaction & prototyping, user testing & validation
+3. Software & Technology — website & software development, headless & monolithic CMS, platform modernization & integrations, full-stack engineering, security & compliance, ongoing support
+4. Growth & Marketing Ops — market & audience intelligence, white space opportunity, go-to-market activation, SEO/GEO/AI visibility, content systems, lead generation & sales conversion, performance optimization
+
+{TONE_GUIDE}"""
+
+CACHED_SYSTEM = [{"type": "text", "text": MATIC_PREAMBLE, "cache_control": {"type": "ephemeral"}}]
+
+_decoder = json.JSONDecoder()
+
+def _extract_json(text, opener):
+    """Decode the first JSON value opening with `opener` ("{" or "["), ignoring any prose
+    around it. Returns None when there is none; raises ValueError if it is malformed."""
+    start = text.find(opener)
+    if start == -1:
+        return None
+    try:
+        return _json_loads(text[start:])   # the usual case: nothing after the JSON
+    except ValueError:
+        return _decoder.raw_decode(text, start)[0]
+
+
+_VERDICT = re.compile(r'"relevant"\s*:\s*(true|false)')
+
+def _stream_verdict(**request):
+    """Stream a single-article evaluation and return its text. A rejection is just
+    {"relevant": false}, so stop reading the moment the verdict turns out false and
+    return that object rather than the partial reply."""
+    with claude.messages.stream(**request) as stream:
+        # Only the opening few tokens are buffered here — the verdict is the first field
+        head = ""
+        for chunk in stream.text_stream:
+            head += chunk
+            if m := _VERDICT.search(head):
+                if m.group(1) == "false":
+                    # Leaving the block closes the connection, which stops generation
+                    _record_usage(getattr(stream, "current_message_snapshot", None))
+                    return '{"relevant": false}'
+                break
+        # Relevant: let the SDK read the rest and assemble the full reply
+        message = stream.get_final_message()
+        _record_usage(message)
+        return message.content[0].text
+
+
+@cached_evaluation(lambda industry_name: industry_name)
+def evaluate_and_summarize(article, industry_name):
+    prompt = f"""You work with clients in the {industry_name} space.
+
+Evaluate this article. Is it genuinely relevant to the {industry_name} industry?
+
+{_relevance_rules(industry_name)}
+
+Article:
+{_article_block(article)}
+
+If relevant, respond with ONLY this JSON (no other text), written in the tone described above:
+{_output_spec(industry_name)}
 
 If NOT relevant, respond with ONLY:
 {{"relevant": false}}"""
 
     try:
-        message = claude.messages.create(
-            model="claude-haiku-4-5-20251001",
+        text = _with_retry(lambda: _stream_verdict(
+            model=CLAUDE_MODEL,
             max_tokens=900,
+            system=CACHED_SYSTEM,
             messages=[{"role": "user", "content": prompt}]
-        )
-        text = message.content[0].text.strip()
-        start = text.find("{")
-        end   = text.rfind("}") + 1
-        if start != -1 and end > start:
-            return json.loads(text[start:end])
-        return {"relevant": False}
+        ))
+        return _extract_json(text, "{") or {"relevant": False}
     except Exception as e:
         print(f"    ⚠ Evaluation error: {e}")
-        return {"relevant": False}
+        return {"relevant": False, "error": str(e)}
+
+
+def _request_batch(articles, industry_name):
+    """One Claude call for several articles; returns {article number: result} for the ones it answered."""
+    listing = "\n\n".join(f"### ARTICLE {n}\n{_article_block(a)}" for n, a in enumerate(articles, 1))
+    prompt = f"""You work with clients in the {industry_name} space.
+
+Evaluate each of the {len(articles)} articles below. Is each one genuinely relevant to the {industry_name} industry?
+
+{_relevance_rules(industry_name)}
+
+{listing}
+
+Respond with ONLY a JSON array (no other text) containing one object per article, in order.
+Every object starts with an "id" field holding the article number.
+For a relevant article, the rest of the object follows this shape, written in the tone described above:
+{_output_spec(industry_name)}
+
+For an article that is NOT relevant, the object is ONLY:
+{{"id": <article number>, "relevant": false}}"""
+
+    try:
+        message = _with_retry(lambda: claude.messages.create(
+            model=CLAUDE_MODEL,
+            max_tokens=900 * len(articles),
+            system=CACHED_SYSTEM,
+            messages=[{"role": "user", "content": prompt}]
+        ))
+        items = _extract_json(message.content[0].text, "[")
+        if not isinstance(items, list):
+            return {}
+        answered = {}
+        for item in items:
+            if isinstance(item, dict) and "relevant" in item and isinstance(item.get("id"), int):
+                answered[item.pop("id")] = item
+        return answered
+    except Exception as e:
+        print(f"    ⚠ Batch evaluation error ({industry_name}): {e}")
+        return {}
+
+
+def evaluate_batch(articles, industry_name):
+    """Evaluate a list of articles in shared-prompt batches; returns one result per article, in order.
+
+    Cached articles are skipped, and anything the batch reply leaves out or mangles
+    falls back to evaluate_and_summarize.
+    """
+    results = [None] * len(articles)
+    pending = []
+    for i, article in enumerate(articles):
+        if article.get("url"):
+            results[i] = _cache_get(_cache_key(article, industry_name))
+        if results[i] is None:
+            pending.append(i)
+
+    # Slices of BATCH_SIZE go out side by side: each reply stays well inside max_tokens,
+    # and a long output is generated in parallel rather than in one sequential stream.
+    slices = [pending[k:k + BATCH_SIZE] for k in range(0, len(pending), BATCH_SIZE)]
+    if slices:
+        with ThreadPoolExecutor(max_workers=len(slices)) as pool:
+            replies = pool.map(lambda part: _request_batch([articles[i] for i in part], industry_name), slices)
+            for part, answered in zip(slices, replies):
+                for n, i in enumerate(part, 1):
+                    if n in answered:
+                        results[i] = answered[n]
+                        if articles[i].get("url"):
+                            _cache_put(_cache_key(articles[i], industry_name), answered[n])
+
+    missing = [i for i, result in enumerate(results) if result is None]
+    if missing:
+        with ThreadPoolExecutor(max_workers=CLAUDE_WORKERS) as pool:
+            retried = pool.map(lambda i: evaluate_and_summarize(articles[i], industry_name), missing)
+            for i, result in zip(missing, retried):
+                results[i] = result
+    return results
 
 
 # ── Named account tracking ────────────────────────────────────────────────────
 def fetch_account_news(account):
     """Fetch recent news about a named account by exact company name (+ any aliases)."""
-    names = [account["name"]] + account.get("aliases", [])
-    query = " OR ".join(f'"{n}"' for n in names)
-    from_date = (datetime.now() - timedelta(days=config.get("days_back", 7))).strftime("%Y-%m-%d")
-    params = {
-        "q":        query,
-        "from":     from_date,
-        "sortBy":   "relevancy",
-        "language": "en",
-        "pageSize": ACCOUNTS_FETCH,
-        "apiKey":   NEWS_API_KEY,
-    }
     try:
-        r = requests.get("https://newsapi.org/v2/everything", params=params, timeout=10)
-        data = r.json()
+        data = _json_loads(_newsapi_search(account["_query"], FROM_DATE, ACCOUNTS_FETCH))
         if data.get("status") != "ok":
             return []
         articles = data.get("articles", [])
@@ -225,6 +582,7 @@ def fetch_account_news(account):
         return []
 
 
+@cached_evaluation(_account_scope)
 def evaluate_account_article(article, account):
     """Evaluate if an article is genuinely about this account and generate email/note."""
     is_prospect = account.get("type", "prospect").lower() == "prospect"
@@ -238,9 +596,7 @@ def evaluate_account_article(article, account):
     else:
         output_spec = '"relationship_note": "1-2 sentences. A sharp talking point a Matic account manager can use in their next check-in with {name}. Reference the news. Connect it to something the team is likely working on. Conversational, not formal."'.format(name=account["name"])
 
-    prompt = f"""You are a senior strategist at Matic Digital, a full-service branding, design, and technology agency.
-
-You are reviewing a news article to see if it is genuinely and substantively about {account["name"]}, a company Matic is tracking.
+    prompt = f"""You are reviewing a news article to see if it is genuinely and substantively about {account["name"]}, a company Matic is tracking.
 {context_line}
 
 Article:
@@ -266,909 +622,125 @@ If NOT genuinely about {account["name"]}, respond with ONLY:
 {{"relevant": false}}"""
 
     try:
-        message = claude.messages.create(
-            model="claude-haiku-4-5-20251001",
+        text = _with_retry(lambda: _stream_verdict(
+            model=CLAUDE_MODEL,
             max_tokens=700,
+            system=CACHED_SYSTEM,
             messages=[{"role": "user", "content": prompt}]
-        )
-        text = message.content[0].text.strip()
-        start = text.find("{")
-        end   = text.rfind("}") + 1
-        if start != -1 and end > start:
-            return json.loads(text[start:end])
-        return {"relevant": False}
+        ))
+        return _extract_json(text, "{") or {"relevant": False}
     except Exception as e:
         print(f"    ⚠ Account evaluation error ({account['name']}): {e}")
-        return {"relevant": False}
+        return {"relevant": False, "error": str(e)}
 
 
 # ── STEP 3: Build the HTML digest page ───────────────────────────────────────
-def generate_html(all_industry_articles, account_hits=[]):
-    date_str  = datetime.now().strftime("%B %d, %Y")
-    week_of   = datetime.now().strftime("Week of %B %d, %Y")
-    total     = sum(len(ind["articles"]) for ind in all_industry_articles)
-
-    accent_colors = {
-        "Renewable Energy":        "#16a34a",
-        "Health & Wellness":       "#2563eb",
-        "Marketing Tech":          "#ea580c",
-        "Tourism":                 "#db2777",
-        "Fintech":                 "#7c3aed",
-        "Artificial Intelligence": "#0891b2",
-    }
+ACCENT_COLORS = {
+    "Renewable Energy":        "#16a34a",
+    "Health & Wellness":       "#2563eb",
+    "Marketing Tech":          "#ea580c",
+    "Tourism":                 "#db2777",
+    "Fintech":                 "#7c3aed",
+    "Artificial Intelligence": "#0891b2",
+}
 
-    nav_links = ""
-    for ind in all_industry_articles:
-        anchor = ind["name"].lower().replace(" ", "-").replace("&", "and")
-        nav_links += f'<a href="#{anchor}">{ind["name"]}</a>\n'
+# The page template is parsed and compiled once per process; autoescape covers
+# every field that comes from NewsAPI, RSS or Claude.
+_templates = jinja2.Environment(
+    loader=jinja2.FileSystemLoader(os.path.join(os.path.dirname(os.path.abspath(__file__)), "templates")),
+    autoescape=True,
+    auto_reload=False,
+    cache_size=-1,
+    trim_blocks=True,
+    lstrip_blocks=True,
+)
+_templates.filters["format_date"] = format_date
+_templates.policies["json.dumps_function"] = _json_dumps   # used by |tojson
+_templates.policies["json.dumps_kwargs"]   = {}
+_digest_template = _templates.get_template("digest.html.j2")
+
+
+# Everything a card renders, resolved up front — the template reads plain tuple
+# fields instead of chasing nested dict lookups and calling filters per card.
+Card = namedtuple("Card", "title url source image summary agency points published email_id email_subject email_body")
+
+
+def _build_cards(all_industry_articles, now):
+    """One pass over every article; returns (sections, article count, URLs for NotebookLM)."""
+    sections, all_urls = [], []
+    card_idx = 0
+    for i, ind in enumerate(all_industry_articles):
+        cards = []
+        for a in ind["articles"]:
+            em       = a.get("outreach_email") or {}
+            email_id = f"art-email-{card_idx}" if em.get("subject") and em.get("body") else None
+            cards.append(Card(
+                title         = a.get("title", ""),
+                url           = a.get("url", ""),
+                source        = a["source"].get("name", ""),
+                image         = a.get("urlToImage"),
+                summary       = a.get("summary", ""),
+                agency        = a.get("agency_relevance", ""),
+                points        = a.get("talking_points", []),
+                published     = format_date(a.get("publishedAt", ""), now),
+                email_id      = email_id,
+                email_subject = em.get("subject"),
+                email_body    = em.get("body"),
+            ))
+            card_idx += 1
+            if a.get("url"):
+                all_urls.append(a["url"])
+        # Per-industry values are computed once here and shared by the nav and the section
+        sections.append({
+            "name":   ind["name"],
+            "anchor": ind["name"].lower().replace(" ", "-").replace("&", "and"),
+            "accent": ACCENT_COLORS.get(ind["name"], "#111111"),
+            "num":    f"{i + 1:02d}",
+            "cards":  cards,
+        })
+    return sections, card_idx, all_urls
 
-    all_urls = [a["url"] for ind in all_industry_articles for a in ind["articles"] if a.get("url")]
 
-    sections = ""
-    card_idx  = 0
-    for i, ind in enumerate(all_industry_articles):
-        anchor = ind["name"].lower().replace(" ", "-").replace("&", "and")
-        accent = accent_colors.get(ind["name"], "#111111")
-        num    = str(i + 1).zfill(2)
-        cards  = ""
-
-        if not ind["articles"]:
-            cards = """
-            <div class="card empty-card">
-              <div class="card-body">
-                <div class="empty-msg">Nothing noteworthy surfaced this week.</div>
-              </div>
-            </div>"""
-        else:
-            for article in ind["articles"]:
-                if article.get("urlToImage"):
-                    img_html = f'<img class="card-img" src="{article["urlToImage"]}" alt="" onerror="this.style.display=\'none\'">'
-                else:
-                    img_html = f'<div class="card-img-accent" style="background:{accent};"></div>'
-
-                tp_html   = "".join(f"<li>{pt}</li>" for pt in article.get("talking_points", []))
-                timestamp = format_date(article.get("publishedAt", ""))
-                ts_html   = f'<span class="timestamp">{timestamp}</span>' if timestamp else ""
-
-                # Outreach email block
-                em = article.get("outreach_email")
-                if em and em.get("subject") and em.get("body"):
-                    email_id      = f"art-email-{card_idx}"
-                    email_subject = em["subject"].replace('"', "&quot;")
-                    email_body    = em["body"].replace("<", "&lt;").replace(">", "&gt;")
-                    email_html    = f"""
-                    <div class="email-block" style="--accent:{accent};">
-                      <div class="email-block-header">
-                        <div class="meta-label" style="color:var(--accent);">Outreach draft</div>
-                        <button class="copy-email-btn" onclick="copyEmail(this, '{email_subject}', '{email_id}')">Copy</button>
-                      </div>
-                      <div class="email-subject">Subject: {email_subject}</div>
-                      <div class="email-body" id="{email_id}">{email_body}</div>
-                    </div>"""
-                else:
-                    email_html = ""
-
-                card_idx += 1
-
-                cards += f"""
-                <div class="card" style="--accent:{accent};">
-                  {img_html}
-                  <div class="card-body">
-                    <div class="source">{article['source']['name']}{ts_html}</div>
-                    <div class="headline">{article['title']}</div>
-                    <div class="summary">{article.get('summary', '')}</div>
-
-                    <div class="meta-block">
-                      <div class="meta-label">Why it matters</div>
-                      <div class="meta-text">{article.get('agency_relevance', '')}</div>
-                    </div>
-
-                    <div class="meta-block">
-                      <div class="meta-label">Talking points</div>
-                      <ul class="talking-points">{tp_html}</ul>
-                    </div>
-
-                    {email_html}
-
-                    <a href="{article['url']}" target="_blank" class="read-more">
-                      Read full article <span class="arrow">→</span>
-                    </a>
-                  </div>
-                </div>"""
-
-        sections += f"""
-        <section id="{anchor}" style="--accent:{accent};">
-          <div class="section-header">
-            <div class="section-title">
-              <span class="section-num">{num}</span>{ind["name"]}
-            </div>
-            <div class="section-meta">{len(ind["articles"])} articles this week</div>
-          </div>
-          <div class="grid">{cards}</div>
-        </section>"""
-
-    urls_js = json.dumps(all_urls)
-
-    # ── On Our Radar section ──────────────────────────────────────────────────
-    radar_html = ""
-    if account_hits:
-        radar_cards = ""
-        for i, hit in enumerate(account_hits):
-            acct    = hit["account"]
-            art     = hit["article"]
-            is_prospect = acct.get("type", "prospect").lower() == "prospect"
-            badge_cls   = "badge-prospect" if is_prospect else "badge-client"
-            badge_label = "Prospect" if is_prospect else "Client"
-            ts          = format_date(art.get("publishedAt", ""))
-            ts_str      = f" · {ts}" if ts else ""
-            email_id    = f"email-body-{i}"
-
-            if is_prospect and hit.get("outreach_email"):
-                em      = hit["outreach_email"]
-                subject = em.get("subject", "").replace('"', "&quot;")
-                body    = em.get("body", "").replace("<", "&lt;").replace(">", "&gt;")
-                action_block = f"""
-                <div class="email-block">
-                  <div class="email-block-header">
-                    <div class="radar-meta-label">Outreach draft</div>
-                    <button class="copy-email-btn" onclick="copyEmail(this, '{subject}', '{email_id}')">Copy</button>
-                  </div>
-                  <div class="email-subject">Subject: {subject}</div>
-                  <div class="email-body" id="{email_id}">{body}</div>
-                </div>"""
-            elif not is_prospect and hit.get("relationship_note"):
-                action_block = f"""
-                <div class="radar-meta-block client-block">
-                  <div class="radar-meta-label">Relationship talking point</div>
-                  <div class="radar-meta-text">{hit["relationship_note"]}</div>
-                </div>"""
-            else:
-                action_block = ""
-
-            radar_cards += f"""
-            <div class="radar-card">
-              <div class="radar-card-top">
-                <div class="account-name">{acct["name"]}</div>
-                <span class="account-badge {badge_cls}">{badge_label}</span>
-              </div>
-              <div>
-                <div class="radar-article-source">{art["source"]["name"]}{ts_str}</div>
-                <div class="radar-article-headline">{art["title"]}</div>
-              </div>
-              <div class="radar-summary">{hit["summary"]}</div>
-              <div class="radar-meta-block">
-                <div class="radar-meta-label">Strategic angle</div>
-                <div class="radar-meta-text">{hit["strategic_angle"]}</div>
-              </div>
-              {action_block}
-            </div>"""
-
-        radar_html = f"""
-        <div class="radar-section">
-          <div class="radar-header">
-            <div class="radar-title">🎯 On Our Radar</div>
-            <div class="radar-meta">{len(account_hits)} account{"s" if len(account_hits) != 1 else ""} in the news this week</div>
-          </div>
-          <div class="radar-grid">{radar_cards}</div>
-        </div>"""
-
-    return f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-  <meta charset="UTF-8">
-  <meta name="viewport" content="width=device-width, initial-scale=1.0">
-  <title>Matic Digest — {date_str}</title>
-  <link rel="preconnect" href="https://fonts.googleapis.com">
-  <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-  <link href="https://fonts.googleapis.com/css2?family=Inter:ital,opsz,wght@0,14..32,300;0,14..32,400;0,14..32,500;0,14..32,600;0,14..32,700;1,14..32,400&display=swap" rel="stylesheet">
-  <style>
-    *, *::before, *::after {{ box-sizing: border-box; margin: 0; padding: 0; }}
-
-    :root {{
-      --bg:        #F3F2EF;
-      --surface:   #ffffff;
-      --ink:       #0f0f0f;
-      --ink-2:     rgba(15,15,15,0.6);
-      --ink-3:     rgba(15,15,15,0.35);
-      --rule:      #E0DDD8;
-      --shadow:    0 1px 2px rgba(0,0,0,.06), 0 0 0 1px rgba(0,0,0,.05);
-      --shadow-up: 0 8px 40px rgba(0,0,0,.10), 0 0 0 1px rgba(0,0,0,.05);
-    }}
-
-    html {{ scroll-behavior: smooth; }}
-
-    body {{
-      font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif;
-      background: var(--bg);
-      color: var(--ink);
-      line-height: 1.6;
-      -webkit-font-smoothing: antialiased;
-      font-feature-settings: "kern" 1, "liga" 1;
-    }}
-
-    /* ── Header ── */
-    .site-header {{
-      background: var(--ink);
-      padding: 40px 56px;
-      display: flex;
-      align-items: flex-end;
-      justify-content: space-between;
-      gap: 48px;
-    }}
-    .brand h1 {{
-      font-size: 15px;
-      font-weight: 600;
-      color: #fff;
-      letter-spacing: -0.1px;
-    }}
-    .brand p {{
-      font-size: 11px;
-      color: rgba(255,255,255,0.3);
-      margin-top: 4px;
-      letter-spacing: 0.3px;
-    }}
-    .header-stats {{
-      display: flex;
-      gap: 40px;
-      align-items: flex-end;
-    }}
-    .stat {{ text-align: right; }}
-    .stat-value {{
-      font-size: 36px;
-      font-weight: 300;
-      color: #fff;
-      letter-spacing: -1.5px;
-      line-height: 1;
-    }}
-    .stat-label {{
-      font-size: 9px;
-      color: rgba(255,255,255,0.3);
-      text-transform: uppercase;
-      letter-spacing: 1.2px;
-      margin-top: 5px;
-    }}
-    .stat-divider {{
-      width: 1px;
-      height: 48px;
-      background: rgba(255,255,255,0.1);
-    }}
-
-    /* ── Nav ── */
-    .site-nav {{
-      position: sticky;
-      top: 0;
-      z-index: 100;
-      background: var(--surface);
-      border-bottom: 1px solid var(--rule);
-      padding: 0 56px;
-      display: flex;
-      align-items: stretch;
-      overflow-x: auto;
-      -webkit-overflow-scrolling: touch;
-    }}
-    .nav-links {{ display: flex; align-items: stretch; }}
-    .site-nav a {{
-      display: flex;
-      align-items: center;
-      padding: 0 16px;
-      height: 48px;
-      font-size: 10px;
-      font-weight: 600;
-      color: var(--ink-3);
-      text-decoration: none;
-      white-space: nowrap;
-      letter-spacing: 0.8px;
-      text-transform: uppercase;
-      border-bottom: 2px solid transparent;
-      transition: color .15s, border-color .15s;
-    }}
-    .site-nav a:first-child {{ padding-left: 0; }}
-    .site-nav a:hover {{ color: var(--ink); border-bottom-color: var(--ink); }}
-    .nav-action {{
-      margin-left: auto;
-      display: flex;
-      align-items: center;
-      padding-left: 32px;
-    }}
-    .notebook-btn {{
-      display: inline-flex;
-      align-items: center;
-      gap: 8px;
-      background: var(--ink);
-      color: #fff;
-      border: none;
-      cursor: pointer;
-      padding: 9px 18px;
-      border-radius: 2px;
-      font-size: 10px;
-      font-family: 'Inter', sans-serif;
-      font-weight: 600;
-      letter-spacing: 0.6px;
-      text-transform: uppercase;
-      transition: opacity .15s;
-    }}
-    .notebook-btn:hover {{ opacity: 0.75; }}
-
-    /* ── Main ── */
-    main {{
-      max-width: 1440px;
-      margin: 0 auto;
-      padding: 72px 56px 96px;
-    }}
-
-    /* ── Section ── */
-    section {{ margin-bottom: 96px; }}
-    .section-header {{
-      display: flex;
-      align-items: baseline;
-      justify-content: space-between;
-      border-top: 3px solid var(--accent, #111);
-      padding-top: 22px;
-      margin-bottom: 32px;
-    }}
-    .section-title {{
-      font-size: 32px;
-      font-weight: 700;
-      letter-spacing: -0.8px;
-      color: var(--ink);
-      display: flex;
-      align-items: baseline;
-      gap: 14px;
-    }}
-    .section-num {{
-      font-size: 14px;
-      font-weight: 400;
-      color: var(--accent, rgba(15,15,15,0.3));
-    }}
-    .section-meta {{
-      font-size: 11px;
-      color: var(--ink-3);
-    }}
-
-    /* ── Grid ── */
-    .grid {{
-      display: grid;
-      grid-template-columns: repeat(4, 1fr);
-      gap: 16px;
-      align-items: start;
-    }}
-
-    /* ── Card ── */
-    .card {{
-      background: var(--surface);
-      border-radius: 3px;
-      overflow: hidden;
-      box-shadow: var(--shadow);
-      transition: box-shadow .25s, transform .25s;
-      display: flex;
-      flex-direction: column;
-    }}
-    .card:hover {{
-      box-shadow: var(--shadow-up);
-      transform: translateY(-3px);
-    }}
-    .card-img {{
-      width: 100%;
-      height: 160px;
-      object-fit: cover;
-      display: block;
-    }}
-    .card-img-accent {{
-      height: 4px;
-      width: 100%;
-    }}
-    .card-body {{
-      padding: 22px 22px 24px;
-      display: flex;
-      flex-direction: column;
-      flex: 1;
-      gap: 14px;
-    }}
-    .source {{
-      font-size: 9px;
-      font-weight: 600;
-      text-transform: uppercase;
-      letter-spacing: 1.2px;
-      color: var(--ink-3);
-      display: flex;
-      align-items: center;
-      justify-content: space-between;
-      gap: 8px;
-    }}
-    .timestamp {{
-      font-size: 9px;
-      font-weight: 400;
-      text-transform: none;
-      letter-spacing: 0;
-      color: var(--ink-3);
-      flex-shrink: 0;
-    }}
-    .headline {{
-      font-size: 15px;
-      font-weight: 600;
-      line-height: 1.4;
-      color: var(--ink);
-      letter-spacing: -0.1px;
-    }}
-    .summary {{
-      font-size: 13px;
-      line-height: 1.75;
-      color: var(--ink-2);
-    }}
-    .meta-block {{
-      background: rgba(0,0,0,.02);
-      border-left: 2px solid var(--accent, #ddd);
-      padding: 13px 15px;
-      border-radius: 0 2px 2px 0;
-    }}
-    .meta-label {{
-      font-size: 8px;
-      font-weight: 700;
-      text-transform: uppercase;
-      letter-spacing: 1.4px;
-      color: var(--accent, #999);
-      margin-bottom: 7px;
-    }}
-    .meta-text {{
-      font-size: 12px;
-      line-height: 1.7;
-      color: var(--ink-2);
-    }}
-    .talking-points {{
-      list-style: none;
-      display: flex;
-      flex-direction: column;
-      gap: 8px;
-    }}
-    .talking-points li {{
-      font-size: 12px;
-      line-height: 1.65;
-      color: var(--ink-2);
-      padding-left: 14px;
-      position: relative;
-    }}
-    .talking-points li::before {{
-      content: '—';
-      position: absolute;
-      left: 0;
-      color: var(--accent, #ccc);
-    }}
-    .read-more {{
-      margin-top: auto;
-      display: inline-flex;
-      align-items: center;
-      gap: 6px;
-      font-size: 10px;
-      font-weight: 600;
-      color: var(--ink);
-      text-decoration: none;
-      letter-spacing: 0.6px;
-      text-transform: uppercase;
-      transition: gap .2s;
-    }}
-    .read-more:hover {{ gap: 10px; }}
-
-    /* ── On Our Radar ── */
-    .radar-section {{
-      margin-bottom: 80px;
-      padding: 36px 40px;
-      background: var(--surface);
-      border-radius: 4px;
-      border-left: 4px solid #d97706;
-      box-shadow: var(--shadow);
-    }}
-    .radar-header {{
-      display: flex;
-      align-items: baseline;
-      justify-content: space-between;
-      margin-bottom: 28px;
-    }}
-    .radar-title {{
-      font-size: 22px;
-      font-weight: 700;
-      letter-spacing: -0.4px;
-      color: var(--ink);
-    }}
-    .radar-meta {{
-      font-size: 11px;
-      color: var(--ink-3);
-    }}
-    .radar-grid {{
-      display: grid;
-      grid-template-columns: repeat(2, 1fr);
-      gap: 16px;
-      align-items: start;
-    }}
-    .radar-card {{
-      background: var(--bg);
-      border-radius: 3px;
-      padding: 22px;
-      display: flex;
-      flex-direction: column;
-      gap: 14px;
-      border: 1px solid var(--rule);
-    }}
-    .radar-card-top {{
-      display: flex;
-      align-items: center;
-      justify-content: space-between;
-      gap: 12px;
-    }}
-    .account-name {{
-      font-size: 16px;
-      font-weight: 700;
-      color: var(--ink);
-      letter-spacing: -0.2px;
-    }}
-    .account-badge {{
-      font-size: 8px;
-      font-weight: 700;
-      letter-spacing: 1.2px;
-      text-transform: uppercase;
-      padding: 3px 8px;
-      border-radius: 2px;
-      flex-shrink: 0;
-    }}
-    .badge-prospect {{
-      background: #fef3c7;
-      color: #92400e;
-    }}
-    .badge-client {{
-      background: #dcfce7;
-      color: #14532d;
-    }}
-    .radar-article-headline {{
-      font-size: 14px;
-      font-weight: 600;
-      color: var(--ink);
-      line-height: 1.45;
-      letter-spacing: -0.1px;
-    }}
-    .radar-article-source {{
-      font-size: 9px;
-      font-weight: 600;
-      text-transform: uppercase;
-      letter-spacing: 1.2px;
-      color: var(--ink-3);
-    }}
-    .radar-summary {{
-      font-size: 13px;
-      line-height: 1.7;
-      color: var(--ink-2);
-    }}
-    .radar-meta-block {{
-      background: rgba(217,119,6,0.06);
-      border-left: 2px solid #d97706;
-      padding: 12px 14px;
-      border-radius: 0 2px 2px 0;
-      display: flex;
-      flex-direction: column;
-      gap: 6px;
-    }}
-    .radar-meta-block.client-block {{
-      background: rgba(22,163,74,0.06);
-      border-left-color: #16a34a;
-    }}
-    .radar-meta-label {{
-      font-size: 8px;
-      font-weight: 700;
-      text-transform: uppercase;
-      letter-spacing: 1.4px;
-      color: #d97706;
-    }}
-    .radar-meta-block.client-block .radar-meta-label {{
-      color: #16a34a;
-    }}
-    .radar-meta-text {{
-      font-size: 12px;
-      line-height: 1.65;
-      color: var(--ink-2);
-    }}
-    .email-block {{
-      background: var(--surface);
-      border: 1px solid var(--rule);
-      border-radius: 3px;
-      padding: 14px 16px;
-      display: flex;
-      flex-direction: column;
-      gap: 10px;
-    }}
-    .email-block-header {{
-      display: flex;
-      align-items: center;
-      justify-content: space-between;
-    }}
-    .copy-email-btn {{
-      font-size: 9px;
-      font-weight: 700;
-      letter-spacing: 0.8px;
-      text-transform: uppercase;
-      background: var(--ink);
-      color: #fff;
-      border: none;
-      border-radius: 2px;
-      padding: 5px 10px;
-      cursor: pointer;
-      font-family: 'Inter', sans-serif;
-      transition: opacity .15s;
-    }}
-    .copy-email-btn:hover {{ opacity: 0.7; }}
-    .email-subject {{
-      font-size: 11px;
-      font-weight: 600;
-      color: var(--ink);
-    }}
-    .email-body {{
-      font-size: 12px;
-      line-height: 1.75;
-      color: var(--ink-2);
-      white-space: pre-wrap;
-    }}
-    @media (max-width: 1024px) {{
-      .radar-grid {{ grid-template-columns: 1fr; }}
-      .radar-section {{ padding: 28px 28px; }}
-    }}
-    @media (max-width: 640px) {{
-      .radar-section {{ padding: 20px 16px; margin-bottom: 48px; }}
-      .radar-title {{ font-size: 18px; }}
-    }}
-
-    /* ── Empty card ── */
-    .empty-card {{
-      grid-column: 1 / -1;
-      background: transparent;
-      box-shadow: none;
-      border: 1px dashed var(--rule);
-    }}
-    .empty-card:hover {{
-      box-shadow: none;
-      transform: none;
-    }}
-    .empty-msg {{
-      font-size: 13px;
-      color: var(--ink-3);
-      padding: 32px 22px;
-      font-style: italic;
-    }}
-
-    /* ── Footer ── */
-    .site-footer {{
-      border-top: 1px solid var(--rule);
-      padding: 32px 56px;
-      display: flex;
-      align-items: center;
-      justify-content: space-between;
-      background: var(--surface);
-    }}
-    .footer-left {{
-      display: flex;
-      align-items: center;
-      gap: 20px;
-    }}
-    .footer-logo {{
-      font-size: 13px;
-      font-weight: 600;
-      color: var(--ink);
-    }}
-    .footer-divider {{
-      width: 1px;
-      height: 14px;
-      background: var(--rule);
-    }}
-    .footer-tagline {{
-      font-size: 11px;
-      color: var(--ink-3);
-    }}
-    .footer-meta {{
-      font-size: 11px;
-      color: var(--ink-3);
-    }}
-
-    /* ── Tablet (2 columns) ── */
-    @media (max-width: 1024px) {{
-      .grid {{
-        grid-template-columns: repeat(2, 1fr);
-      }}
-      .site-header {{
-        padding: 32px 32px;
-      }}
-      .stat-value {{
-        font-size: 28px;
-      }}
-      main {{
-        padding: 56px 32px 72px;
-      }}
-      .site-nav {{
-        padding: 0 32px;
-      }}
-      .site-nav a:first-child {{
-        padding-left: 16px;
-      }}
-      .site-footer {{
-        padding: 28px 32px;
-      }}
-    }}
-
-    /* ── Mobile (1 column) ── */
-    @media (max-width: 640px) {{
-      .site-header {{
-        padding: 24px 20px;
-        flex-direction: column;
-        align-items: flex-start;
-        gap: 20px;
-      }}
-      .header-stats {{
-        width: 100%;
-        gap: 0;
-        justify-content: space-between;
-        align-items: flex-end;
-      }}
-      .stat {{
-        text-align: left;
-        flex: 1;
-      }}
-      .stat-value {{
-        font-size: 26px;
-        letter-spacing: -1px;
-      }}
-      .stat-divider {{
-        display: none;
-      }}
-      .site-nav {{
-        padding: 0 16px;
-      }}
-      .site-nav a {{
-        padding: 0 10px;
-        font-size: 9px;
-        height: 44px;
-      }}
-      .site-nav a:first-child {{
-        padding-left: 0;
-      }}
-      .nav-action {{
-        padding-left: 12px;
-      }}
-      .notebook-btn .btn-label {{
-        display: none;
-      }}
-      .notebook-btn {{
-        font-size: 14px;
-        padding: 8px 10px;
-        letter-spacing: 0;
-      }}
-      main {{
-        padding: 32px 16px 56px;
-      }}
-      .section-header {{
-        flex-direction: column;
-        gap: 4px;
-      }}
-      .section-title {{
-        font-size: 22px;
-        letter-spacing: -0.4px;
-      }}
-      .section-meta {{
-        font-size: 10px;
-      }}
-      .grid {{
-        grid-template-columns: 1fr;
-        gap: 12px;
-      }}
-      .card-img {{
-        height: 180px;
-      }}
-      .card-body {{
-        padding: 16px 16px 20px;
-        gap: 12px;
-      }}
-      .headline {{
-        font-size: 15px;
-      }}
-      .summary {{
-        font-size: 13px;
-      }}
-      .meta-text {{
-        font-size: 12px;
-      }}
-      .talking-points li {{
-        font-size: 12px;
-      }}
-      .site-footer {{
-        padding: 24px 16px;
-        flex-direction: column;
-        align-items: flex-start;
-        gap: 8px;
-      }}
-      .footer-left {{
-        flex-direction: column;
-        align-items: flex-start;
-        gap: 4px;
-      }}
-      .footer-divider {{ display: none; }}
-    }}
-  </style>
-</head>
-<body>
-
-<header class="site-header">
-  <div class="brand">
-    <h1>Matic Digest</h1>
-    <p>{week_of} · Industry Intelligence · Internal</p>
-  </div>
-  <div class="header-stats">
-    <div class="stat">
-      <div class="stat-value">{total}</div>
-      <div class="stat-label">Articles</div>
-    </div>
-    <div class="stat-divider"></div>
-    <div class="stat">
-      <div class="stat-value">{len(all_industry_articles)}</div>
-      <div class="stat-label">Industries</div>
-    </div>
-  </div>
-</header>
-
-<nav class="site-nav">
-  <div class="nav-links">
-    {nav_links}
-  </div>
-  <div class="nav-action">
-    <button class="notebook-btn" onclick="copyURLs(this)">↗<span class="btn-label"> Copy URLs for NotebookLM</span></button>
-  </div>
-</nav>
-
-<main>
-  {radar_html}
-  {sections}
-</main>
-
-<footer class="site-footer">
-  <div class="footer-left">
-    <div class="footer-logo">Matic Digital</div>
-    <div class="footer-divider"></div>
-    <div class="footer-tagline">Weekly Industry Intelligence</div>
-  </div>
-  <div class="footer-meta">{week_of} · Internal Use Only</div>
-</footer>
-
-<script>
-  function copyURLs(btn) {{
-    const urls = {urls_js};
-    navigator.clipboard.writeText(urls.join("\\n")).then(() => {{
-      const orig = btn.textContent;
-      btn.textContent = "✓ Copied";
-      setTimeout(() => btn.textContent = orig, 2500);
-    }});
-  }}
-  function copyEmail(btn, subject, bodyId) {{
-    const body = document.getElementById(bodyId).textContent;
-    const full = "Subject: " + subject + "\\n\\n" + body;
-    navigator.clipboard.writeText(full).then(() => {{
-      btn.textContent = "✓ Copied";
-      setTimeout(() => btn.textContent = "Copy", 2000);
-    }});
-  }}
-</script>
-</body>
-</html>"""
+def write_html(out, now, all_industry_articles, account_hits=[]):
+    """Render the digest page for run time `now` straight into the open text file `out`, chunk by chunk."""
+    utc_now = now.astimezone(timezone.utc)   # one clock reading for every relative date
+    industries, total, all_urls = _build_cards(all_industry_articles, utc_now)
+    _digest_template.stream(
+        date_str      = now.strftime("%B %d, %Y"),
+        week_of       = now.strftime("Week of %B %d, %Y"),
+        now           = utc_now,
+        total         = total,
+        industries    = industries,
+        account_hits  = account_hits,
+        all_urls      = all_urls,
+    ).dump(out)
 
 
 # ── STEP 4: Wait for GitHub Pages to deploy ───────────────────────────────────
-def wait_for_deployment(url, timeout=300):
-    import time
-    date_str = datetime.now().strftime("%B %d, %Y")
+def wait_for_deployment(url, date_str, timeout=300):
     print("⏳ Waiting for GitHub Pages to deploy", end="", flush=True)
     start = time.time()
+    # Conditional GETs: while the page is unchanged GitHub answers 304 with no body,
+    # so we only download the HTML again once a new version is live.
+    validators = {}
+    delay = 2   # 2, 4, 8, then every 15s — a quick deploy is noticed within seconds
     while time.time() - start < timeout:
         try:
-            r = requests.get(url, timeout=10)
-            if r.status_code == 200 and date_str in r.text:
-                print(" ✓")
-                return True
+            r = SESSION.get(url, headers=validators, timeout=10)
+            if r.status_code == 200:
+                if date_str in r.text:
+                    print(" ✓")
+                    return True
+                validators = {}
+                if r.headers.get("ETag"):
+                    validators["If-None-Match"] = r.headers["ETag"]
+                if r.headers.get("Last-Modified"):
+                    validators["If-Modified-Since"] = r.headers["Last-Modified"]
         except requests.RequestException:
             pass
         print(".", end="", flush=True)
-        time.sleep(15)
+        time.sleep(delay)
+        delay = min(delay * 2, 15)
     print("\n⚠ Timed out — posting to Slack anyway.")
     return False
 
@@ -1193,26 +765,10 @@ CTA_VARIANTS = [
     "Good week to pay attention. Full digest below.",
 ]
 
-def generate_slack_briefing(all_industry_articles, page_url, account_hits=[]):
-    import random
-    articles_text = ""
-    for ind in all_industry_articles:
-        articles_text += f"\n{ind['name'].upper()}\n"
-        for a in ind["articles"]:
-            articles_text += f"  - {a['title']}: {a.get('summary', '')}\n"
+_EMOJI_MAP = "\n".join(f"  {name}: {emoji}" for name, emoji in INDUSTRY_EMOJI.items())
 
-    cta = random.choice(CTA_VARIANTS)
-
-    # Build emoji map string for the prompt
-    emoji_map = "\n".join(f"  {name}: {emoji}" for name, emoji in INDUSTRY_EMOJI.items())
-
-    prompt = f"""You are writing the weekly Matic Digest briefing for Slack.
-
-Matic Digital is a full-service branding, design, and technology agency with four service areas:
-1. Brand & Creative — brand strategy, identity, messaging, brand systems, rebranding
-2. Experience Design — UX/UI, journey mapping, design systems, prototyping, user testing
-3. Software & Technology — web & software development, CMS, platform modernization, full-stack engineering
-4. Growth & Marketing Ops — go-to-market, SEO/GEO/AI visibility, audience intelligence, lead generation
+# Everything but the CTA and this week's articles is fixed, so the scaffold is built once
+SLACK_PROMPT = f"""You are writing the weekly Matic Digest briefing for Slack.
 
 This briefing goes to the internal strategy team before their week starts.
 
@@ -1229,21 +785,33 @@ FORMAT RULES:
 • (add a third bullet only if there's a genuinely distinct third angle worth calling out)
 
 Use these emojis per industry:
-{emoji_map}
+{_EMOJI_MAP}
 
-- End with this exact line (do not change it): {cta}
+- End with this exact line (do not change it): {{cta}}
 - Use Slack markdown: *bold*, _italic_ where it adds punch
 - Keep bullets tight — one sentence each, no padding
 - Total length: readable in under 90 seconds
 
 This week's articles:
-{articles_text}"""
+{{articles_text}}"""
+
+def generate_slack_briefing(all_industry_articles, page_url, account_hits=[]):
+    parts = []
+    for ind in all_industry_articles:
+        parts.append(f"\n{ind['name'].upper()}\n")
+        for a in ind["articles"]:
+            parts.append(f"  - {a['title']}: {a.get('summary', '')}\n")
+    articles_text = "".join(parts)
 
-    message = claude.messages.create(
-        model="claude-haiku-4-5-20251001",
+    cta    = random.choice(CTA_VARIANTS)
+    prompt = SLACK_PROMPT.format(cta=cta, articles_text=articles_text)
+
+    message = _with_retry(lambda: claude.messages.create(
+        model=CLAUDE_MODEL,
         max_tokens=1200,
+        system=CACHED_SYSTEM,
         messages=[{"role": "user", "content": prompt}]
-    )
+    ))
     briefing = message.content[0].text.strip()
 
     # Prepend "On Our Radar" block if there are account hits
@@ -1262,26 +830,34 @@ This week's articles:
 
 
 # ── STEP 6: Post to Slack ─────────────────────────────────────────────────────
-def post_to_slack(url, total, briefing):
-    date_str = datetime.now().strftime("%B %d, %Y")
-
-    # Slack section blocks have a 3000-character limit — split if needed
-    MAX_BLOCK = 2900
-    briefing_blocks = []
-    while briefing:
-        chunk = briefing[:MAX_BLOCK]
+def split_for_slack(text, max_block=2900):
+    """Split text into chunks under Slack's 3000-char section limit, breaking at a newline or space.
+
+    Walks one index forward over the original string, so each chunk is sliced exactly once.
+    """
+    chunks = []
+    i, n = 0, len(text)
+    while i < n:
+        j = min(i + max_block, n)
         # Don't cut mid-word
-        if len(briefing) > MAX_BLOCK:
-            cut = chunk.rfind("\n")
-            if cut == -1:
-                cut = chunk.rfind(" ")
-            if cut > 0:
-                chunk = briefing[:cut]
-        briefing_blocks.append({
-            "type": "section",
-            "text": {"type": "mrkdwn", "text": chunk}
-        })
-        briefing = briefing[len(chunk):].lstrip()
+        if j < n:
+            cut = text.rfind("\n", i, j)
+            if cut <= i:
+                cut = text.rfind(" ", i, j)
+            if cut > i:
+                j = cut
+        chunks.append(text[i:j])
+        i = j
+        while i < n and text[i].isspace():
+            i += 1
+    return chunks
+
+
+def post_to_slack(url, total, briefing, date_str):
+    briefing_blocks = [
+        {"type": "section", "text": {"type": "mrkdwn", "text": chunk}}
+        for chunk in split_for_slack(briefing)
+    ]
 
     payload = {
         "blocks": [
@@ -1310,88 +886,131 @@ def post_to_slack(url, total, briefing):
             }
         ]
     }
-    r = requests.post(SLACK_WEBHOOK_URL, json=payload)
+    r = SESSION.post(SLACK_WEBHOOK_URL, data=_json_dumps(payload).encode(),
+                     headers={"Content-Type": "application/json"}, timeout=10)
     print("✓ Posted to Slack" if r.status_code == 200 else f"✗ Slack failed ({r.status_code}): {r.text}")
 
 
+# ── Per-industry pipeline ─────────────────────────────────────────────────────
+def process_industry(industry):
+    """Fetch, dedupe and evaluate one industry's candidates; returns {"name", "articles"}."""
+    # Industries run concurrently, so buffer this one's progress and print it as one block
+    log = [f"  {industry['name']} — fetching candidates..."]
+    # NewsAPI and every RSS feed are fetched side by side, so this takes the slowest one's time
+    feed_urls = industry.get("rss_feeds", [])
+    with ThreadPoolExecutor(max_workers=1 + len(feed_urls)) as pool:
+        newsapi = pool.submit(fetch_articles, industry)
+        feeds   = list(pool.map(fetch_from_rss, feed_urls))
+        candidates = newsapi.result()
+    for feed_url, rss in zip(feed_urls, feeds):
+        log.append(f"    + {len(rss)} articles from RSS ({feed_url})")
+        candidates.extend(rss)
+    candidates = deduplicate_articles(candidates)
+    screened   = [a for a in candidates if worth_evaluating(a, industry)]
+    log.append(f"    Pulled {len(candidates)} unique candidates, {len(candidates) - len(screened)} screened out locally. Evaluating relevance...")
+    candidates = screened
+
+    # Batched calls judge every candidate; keep the first ARTICLES_TARGET
+    # relevant ones in candidate order.
+    results = evaluate_batch(candidates, industry["name"])
+
+    good_articles = []
+    for article, result in zip(candidates, results):
+        if len(good_articles) >= ARTICLES_TARGET:
+            break
+        if result.get("relevant"):
+            article["summary"]          = result.get("summary", "")
+            article["agency_relevance"] = result.get("agency_relevance", "")
+            article["talking_points"]   = result.get("talking_points", [])
+            article["outreach_email"]   = result.get("outreach_email")
+            good_articles.append(article)
+            log.append(f"    ✓ {article['title'][:65]}...")
+        else:
+            log.append(f"    ✗ Skipped: {article['title'][:60]}...")
+
+    log.append(f"    → {len(good_articles)} articles kept.\n")
+    print("\n".join(log))
+    return {"name": industry["name"], "articles": good_articles}
+
+
+def process_account(account):
+    """Find the first newsworthy article for one named account; returns a hit dict or None."""
+    # Accounts run concurrently, so buffer this one's progress and print it as one block
+    label = account.get("type", "prospect").upper()
+    log   = [f"  {account['name']} ({label})..."]
+    hit   = None
+    # Keep a window of ACCOUNT_AHEAD evaluations in flight but accept candidates in
+    # NewsAPI's relevance order; nothing past the window is started once one lands.
+    candidates = fetch_account_news(account)
+    with ThreadPoolExecutor(max_workers=ACCOUNT_AHEAD) as pool:
+        futures = [pool.submit(evaluate_account_article, a, account) for a in candidates[:ACCOUNT_AHEAD]]
+        for n, article in enumerate(candidates):
+            result = futures[n].result()
+            if result.get("relevant"):
+                hit = {
+                    "account":           account,
+                    "article":           article,
+                    "summary":           result.get("summary", ""),
+                    "strategic_angle":   result.get("strategic_angle", ""),
+                    "outreach_email":    result.get("outreach_email"),
+                    "relationship_note": result.get("relationship_note"),
+                }
+                log.append(f"    ✓ {article['title'][:65]}...")
+                break
+            if n + ACCOUNT_AHEAD < len(candidates):
+                futures.append(pool.submit(evaluate_account_article, candidates[n + ACCOUNT_AHEAD], account))
+    if hit is None:
+        log.append(f"    — Nothing newsworthy this week.")
+    print("\n".join(log))
+    return hit
+
+
 # ── MAIN ──────────────────────────────────────────────────────────────────────
 def main():
     print("🔍 Starting Matic Digest...\n")
-    all_industry_articles = []
-    total = 0
-
-    for industry in config["industries"]:
-        print(f"  {industry['name']} — fetching candidates...")
-        candidates = fetch_articles(industry)
-        for feed_url in industry.get("rss_feeds", []):
-            rss = fetch_from_rss(feed_url)
-            print(f"    + {len(rss)} articles from RSS ({feed_url})")
-            candidates.extend(rss)
-        candidates = deduplicate_articles(candidates)
-        print(f"    Pulled {len(candidates)} unique candidates. Evaluating relevance...")
-
-        good_articles = []
-        for article in candidates:
-            if len(good_articles) >= ARTICLES_TARGET:
-                break
-            result = evaluate_and_summarize(article, industry["name"])
-            if result.get("relevant"):
-                article["summary"]          = result.get("summary", "")
-                article["agency_relevance"] = result.get("agency_relevance", "")
-                article["talking_points"]   = result.get("talking_points", [])
-                article["outreach_email"]   = result.get("outreach_email")
-                good_articles.append(article)
-                print(f"    ✓ {article['title'][:65]}...")
-            else:
-                print(f"    ✗ Skipped: {article['title'][:60]}...")
-
-        print(f"    → {len(good_articles)} articles kept.\n")
-        all_industry_articles.append({"name": industry["name"], "articles": good_articles})
-        total += len(good_articles)
+    # One clock reading for the whole run, so the filename, page, commit and Slack
+    # header agree even if the run crosses midnight
+    now      = datetime.now()
+    date_str = now.strftime("%B %d, %Y")
+    today    = now.strftime("%Y-%m-%d")
+
+    # Industries are independent and almost entirely network-bound, so run them side by side
+    with ThreadPoolExecutor(max_workers=max(1, len(config["industries"]))) as pool:
+        all_industry_articles = list(pool.map(process_industry, config["industries"]))
+    total = sum(len(ind["articles"]) for ind in all_industry_articles)
 
     # ── Named account tracking ────────────────────────────────────────────────
     account_hits = []
     if config.get("accounts"):
         print("🎯 Checking named accounts...\n")
-        for account in config["accounts"]:
-            label = account.get("type", "prospect").upper()
-            print(f"  {account['name']} ({label})...")
-            candidates = fetch_account_news(account)
-            found = False
-            for article in candidates:
-                result = evaluate_account_article(article, account)
-                if result.get("relevant"):
-                    account_hits.append({
-                        "account":           account,
-                        "article":           article,
-                        "summary":           result.get("summary", ""),
-                        "strategic_angle":   result.get("strategic_angle", ""),
-                        "outreach_email":    result.get("outreach_email"),
-                        "relationship_note": result.get("relationship_note"),
-                    })
-                    print(f"    ✓ {article['title'][:65]}...")
-                    found = True
-                    break
-            if not found:
-                print(f"    — Nothing newsworthy this week.")
+        with ThreadPoolExecutor(max_workers=CLAUDE_WORKERS) as pool:
+            account_hits = [hit for hit in pool.map(process_account, config["accounts"]) if hit]
         print(f"\n  → {len(account_hits)} account hit(s) found.\n")
 
     print("📄 Building HTML digest...")
-    html = generate_html(all_industry_articles, account_hits)
-
-    dated_filename = f"digest_{datetime.now().strftime('%Y-%m-%d')}.html"
+    dated_filename = f"digest_{today}.html"
     base_dir = os.path.dirname(os.path.abspath(__file__))
 
-    for filename in [dated_filename, "index.html"]:
-        with open(os.path.join(base_dir, filename), "w") as f:
-            f.write(html)
+    dated_path = os.path.join(base_dir, dated_filename)
+    index_path = os.path.join(base_dir, "index.html")
+    with open(dated_path, "w", encoding="utf-8", buffering=1 << 16) as f:
+        write_html(f, now, all_industry_articles, account_hits)
+    # index.html is the same page — hardlink it instead of writing it a second time
+    try:
+        os.remove(index_path)
+    except FileNotFoundError:
+        pass
+    try:
+        os.link(dated_path, index_path)
+    except OSError:
+        shutil.copyfile(dated_path, index_path)
 
     print(f"✓ Saved: {dated_filename} + index.html")
 
     print("\n📡 Pushing to GitHub...")
     try:
         subprocess.run(["git", "-C", base_dir, "add", dated_filename, "index.html"], check=True)
-        subprocess.run(["git", "-C", base_dir, "commit", "-m", f"Digest {datetime.now().strftime('%Y-%m-%d')}"], check=True)
+        subprocess.run(["git", "-C", base_dir, "commit", "-m", f"Digest {today}"], check=True)
         subprocess.run(["git", "-C", base_dir, "push", "origin", "main"], check=True)
         print("✓ Pushed to GitHub")
     except subprocess.CalledProcessError as e:
@@ -1399,13 +1018,16 @@ def main():
         return
 
     page_url = "https://jshusak.github.io/matic-digest/"
-    wait_for_deployment(page_url)
+    wait_for_deployment(page_url, date_str)
 
     print("💬 Writing Slack briefing...")
     briefing = generate_slack_briefing(all_industry_articles, page_url, account_hits)
 
+    print(f"🧠 Prompt cache: {_usage['cache_read_input_tokens']} input tokens read from cache, "
+          f"{_usage['cache_creation_input_tokens']} written, {_usage['input_tokens']} uncached.")
+
     print("💬 Posting to Slack...")
-    post_to_slack(page_url, total, briefing)
+    post_to_slack(page_url, total, briefing, date_str)
 
     print(f"\n✓ {total} articles across {len(config['industries'])} industries.")
     print(f"🌐 Live at: {page_url}")